@@ -0,0 +1,36 @@
+"""Optional build script that compiles zoom_summary_to_agenda.py with mypyc.
+
+The script runs fine as plain Python; this exists for batch workloads where
+an ahead-of-time compiled module is worth the build step. When mypy/mypyc is
+not installed the build falls back to a pure-Python install.
+
+Build in place with:
+
+    pip install mypy setuptools
+    python setup.py build_ext --inplace
+
+and invoke the compiled module through the uncompiled launcher shim:
+
+    python zoom_summary_cli.py summary.txt ...
+
+Running zoom_summary_to_agenda.py directly always executes the interpreted
+source; the shim imports the module, so it picks up the compiled extension.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["zoom_summary_to_agenda.py"])
+
+setup(
+    name="supervision-scripts",
+    version="0.1.0",
+    description="Tools for setting up and running postgraduate supervision workspaces.",
+    py_modules=["zoom_summary_to_agenda", "zoom_summary_cli"],
+    python_requires=">=3.9",
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""Thin uncompiled launcher for zoom_summary_to_agenda.
+
+Running ``python3 zoom_summary_to_agenda.py`` always executes the interpreted
+source, and ``python -m`` cannot run a mypyc-compiled extension module, so
+neither reaches the optional compiled build. This shim imports the module —
+picking up an in-place compiled extension when one exists, the plain source
+otherwise — and delegates to its main().
+"""
+
+import sys
+
+import zoom_summary_to_agenda
+
+if __name__ == "__main__":
+    raise SystemExit(zoom_summary_to_agenda.main(sys.argv[1:]))
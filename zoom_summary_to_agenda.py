@@ -16,42 +16,45 @@ See README for full flag descriptions.
 
 from __future__ import annotations
 
-import argparse
+import functools
+import io
 import re
 import sys
-from dataclasses import dataclass
+from itertools import chain
+from types import SimpleNamespace
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
 
 
+# Canonical header names only; split_sections strips a trailing ":" before
+# the lookup, so the ":" variants do not need separate entries.
 SECTION_NAMES = {
     "quick recap": "quick recap",
-    "quick recap:": "quick recap",
     "recap": "quick recap",
-    "recap:": "quick recap",
     "next steps": "next steps",
-    "next steps:": "next steps",
     "actions": "next steps",
-    "actions:": "next steps",
     "summary": "summary",
-    "summary:": "summary",
 }
 
+# First letters of the section headers above, used to skip the lower()+lookup
+# on the vast majority of lines that cannot be headers.
+_HEADER_FIRST = frozenset("qrnasQRNAS")
+
 
 SentenceList = List[str]
 ActionList = List[Tuple[str, str]]
 
 
-@dataclass
-class ParsedSummary:
+class ParsedSummary(NamedTuple):
     quick_recap: SentenceList
     action_items: ActionList
     summary_topics: List[Tuple[str, str]]
 
 
-def load_text(source: Path) -> str:
+def iter_lines(source: Path) -> Iterator[str]:
     try:
-        return source.read_text(encoding="utf-8")
+        with source.open(encoding="utf-8") as handle:
+            yield from handle
     except FileNotFoundError:
         raise SystemExit(f"error: input file '{source}' not found")
 
@@ -60,97 +63,87 @@ def normalise_line(line: str) -> str:
     return line.strip()
 
 
-def split_sections(lines: Iterable[str]) -> dict:
-    sections: dict[str, List[str]] = {"quick recap": [], "next steps": [], "summary": []}
-    current_key: str | None = None
-
-    for raw_line in lines:
-        line = normalise_line(raw_line)
-        if not line:
-            continue
-        key = SECTION_NAMES.get(line.lower())
-        if key:
-            current_key = key
-            continue
-        if current_key is None:
-            continue
-        sections[current_key].append(line)
-
-    return sections
-
-
+# Retained as a fallback for pathological inputs; the manual scan below covers
+# the normal case without entering the regex engine.
 SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
 
+# Maps the sentence-ending characters to a single sentinel so boundary
+# positions can be located with C-level str.find calls.
+_BOUNDARY_TRANS = str.maketrans({".": "\x01", "!": "\x01", "?": "\x01"})
 
-def sentences_from_paragraph(paragraph: str) -> SentenceList:
-    parts = [part.strip() for part in SENTENCE_END_RE.split(paragraph) if part.strip()]
-    return parts or [paragraph.strip()]
-
-
-def parse_quick_recap(lines: Iterable[str]) -> SentenceList:
-    sentences: SentenceList = []
-    for line in lines:
-        sentences.extend(sentences_from_paragraph(line))
-    return sentences
-
-
-def parse_action_items(lines: Iterable[str]) -> ActionList:
-    results: ActionList = []
-    for line in lines:
-        if ":" in line:
-            owner, action = line.split(":", 1)
-            owner = owner.strip()
-            action = action.strip()
-        else:
-            owner = ""
-            action = line.strip()
-        if not action:
-            continue
-        results.append((owner or "TBD", action))
-    return results
 
+def sentences_from_paragraph(paragraph: str) -> SentenceList:
+    parts: SentenceList = []
+    last = 0
+    length = len(paragraph)
+    marked = paragraph.translate(_BOUNDARY_TRANS)
+    pos = marked.find("\x01")
+    while pos != -1:
+        if pos + 1 < length and paragraph[pos + 1].isspace():
+            part = paragraph[last : pos + 1].strip()
+            if part:
+                parts.append(part)
+            last = pos + 1
+        pos = marked.find("\x01", pos + 1)
+    tail = paragraph[last:].strip()
+    if tail:
+        parts.append(tail)
+    if not parts:
+        parts = [part.strip() for part in SENTENCE_END_RE.split(paragraph) if part.strip()]
+    return parts or [paragraph]
+
+
+def parse_summary(lines: Iterable[str]) -> ParsedSummary:
+    """Parse the summary in a single pass, dispatching each line to the
+    parser for the section it belongs to as soon as it is read.
+
+    Lines are stripped once and empty lines skipped here, so the
+    per-section branches can assume non-empty, normalised input.
+    """
+    quick_recap: SentenceList = []
+    action_items: ActionList = []
+    summary_topics: List[Tuple[str, str]] = []
 
-def parse_summary_topics(lines: Iterable[str]) -> List[Tuple[str, str]]:
-    topics: List[Tuple[str, str]] = []
+    current_key: str | None = None
     current_title: str | None = None
-    current_body: List[str] = []
+    current_body = ""
 
-    for line in lines:
+    for raw_line in lines:
+        line = normalise_line(raw_line)
         if not line:
             continue
-        is_title = not re.search(r"[.!?]$", line)
-        if is_title:
-            if current_title or current_body:
-                topics.append(
-                    (
-                        current_title or "Summary",
-                        " ".join(current_body).strip(),
-                    )
-                )
-            current_title = line.strip()
-            current_body = []
+        if line[0] in _HEADER_FIRST:
+            header = line[:-1] if line.endswith(":") else line
+            key = SECTION_NAMES.get(header.lower())
+            if key:
+                current_key = key
+                continue
+        if current_key is None:
             continue
 
-        current_body.append(line.strip())
+        if current_key == "quick recap":
+            quick_recap.extend(sentences_from_paragraph(line))
+        elif current_key == "next steps":
+            if ":" in line:
+                owner, action = line.split(":", 1)
+                owner = owner.strip()
+                action = action.strip()
+            else:
+                owner = ""
+                action = line
+            if action:
+                action_items.append((owner or "TBD", action))
+        else:  # summary: title/body state machine
+            if not line.endswith((".", "!", "?")):
+                if current_title or current_body:
+                    summary_topics.append((current_title or "Summary", current_body))
+                current_title = line
+                current_body = ""
+            else:
+                current_body = f"{current_body} {line}" if current_body else line
 
     if current_title or current_body:
-        topics.append(
-            (
-                current_title or "Summary",
-                " ".join(current_body).strip(),
-            )
-        )
-
-    return topics
-
-
-def parse_summary(text: str) -> ParsedSummary:
-    lines = text.splitlines()
-    sections = split_sections(lines)
-
-    quick_recap = parse_quick_recap(sections["quick recap"])
-    action_items = parse_action_items(sections["next steps"])
-    summary_topics = parse_summary_topics(sections["summary"])
+        summary_topics.append((current_title or "Summary", current_body))
 
     return ParsedSummary(
         quick_recap=quick_recap,
@@ -161,48 +154,57 @@ def parse_summary(text: str) -> ParsedSummary:
 
 def format_agenda(topics: List[Tuple[str, str]]) -> List[str]:
     if topics:
-        return [f"- {title}" for title, _ in topics]
+        return ["- " + title for title, _ in topics]
     return ["- Updates from the supervisory team"]
 
 
-def format_discussion_notes(quick_recap: SentenceList, topics: List[Tuple[str, str]]) -> List[str]:
+@functools.lru_cache(maxsize=128)
+def _format_topic_line(title: str, body: str) -> str:
+    # Templated meeting notes repeat identical (title, body) pairs; cache the
+    # formatted bullet so bulk runs do not re-format them.
+    return "- " + title + ": " + (body or "Discussion captured in Zoom summary.")
+
+
+def format_discussion_notes(quick_recap: Iterable[str], topics: List[Tuple[str, str]]) -> List[str]:
     notes: List[str] = []
-    if quick_recap:
-        if len(quick_recap) == 1:
-            notes.append(f"- Quick recap: {quick_recap[0]}")
+    recap_iter = iter(quick_recap)
+    first = next(recap_iter, None)
+    if first is not None:
+        second = next(recap_iter, None)
+        if second is None:
+            notes.append(f"- Quick recap: {first}")
         else:
-            joined = "; ".join(quick_recap)
+            joined = "; ".join(chain((first, second), recap_iter))
             notes.append(f"- Quick recap: {joined}")
     for title, body in topics:
-        content = body if body else "Discussion captured in Zoom summary."
-        notes.append(f"- {title}: {content}")
+        notes.append(_format_topic_line(title, body))
     if not notes:
         notes.append("- Discussion notes pending.")
     return notes
 
 
+_ACTION_HEADER: Tuple[str, str] = (
+    "| Action | Owner | Due | Status |",
+    "|--------|-------|-----|--------|",
+)
+
+
 def format_action_table(items: ActionList) -> List[str]:
-    rows: List[str] = [
-        "| Action | Owner | Due | Status |",
-        "|--------|-------|-----|--------|",
-    ]
     if not items:
-        rows.append("| No action items recorded | - | - | - |")
-        return rows
-    for owner, action in items:
-        rows.append(f"| {action} | {owner} |  | Open |")
-    return rows
+        return [*_ACTION_HEADER, "| No action items recorded | - | - | - |"]
+    return [*_ACTION_HEADER, *(f"| {action} | {owner} |  | Open |" for owner, action in items)]
 
 
-def build_markdown(parsed: ParsedSummary, args: argparse.Namespace) -> str:
+def build_markdown(parsed: ParsedSummary, args: SimpleNamespace) -> str:
     date_label = args.date or "YYYY-MM-DD"
     time_label = args.time or "TBD"
     connection_label = args.connection or "TBD"
-    if connection_label and connection_label != "TBD":
+    if connection_label != "TBD":
         time_connection = f"{time_label} — {connection_label}"
     else:
         time_connection = time_label
 
+    next_meeting = args.next_meeting or "TBD"
     attendees = args.attendees or args.student or "TBD"
     apologies = args.apologies or "None"
 
@@ -211,34 +213,51 @@ def build_markdown(parsed: ParsedSummary, args: argparse.Namespace) -> str:
     action_table = format_action_table(parsed.action_items)
     follow_up = args.follow_up or "- Note any reminders or checks before the next meeting."
 
-    parts: List[str] = [
-        "---",
-        f"## Meeting {date_label}",
-        "",
-        f"- **Date:** {date_label}",
-        f"- **Time / connection:** {time_connection}",
-        f"- **Next meeting:** {args.next_meeting or 'TBD'}",
-        f"- **Attendees:** {attendees}",
-        f"- **Apologies:** {apologies}",
-        "",
-        "### Agenda",
-        *agenda_lines,
-        "",
-        "### Discussion notes",
-        *discussion_lines,
-        "",
-        "### Action items",
-        *action_table,
-        "",
-        "### Follow-up",
-        follow_up,
-        "",
-    ]
-
-    return "\n".join(parts)
-
-
-def parse_args(argv: List[str]) -> argparse.Namespace:
+    header = f"""---
+## Meeting {date_label}
+
+- **Date:** {date_label}
+- **Time / connection:** {time_connection}
+- **Next meeting:** {next_meeting}
+- **Attendees:** {attendees}
+- **Apologies:** {apologies}
+
+### Agenda
+"""
+
+    return (
+        header
+        + "\n".join(agenda_lines)
+        + "\n\n### Discussion notes\n"
+        + "\n".join(discussion_lines)
+        + "\n\n### Action items\n"
+        + "\n".join(action_table)
+        + "\n\n### Follow-up\n"
+        + follow_up
+        + "\n"
+    )
+
+
+# Flag spelling -> attribute name on the parsed-arguments namespace.
+_FLAG_ATTRS = {
+    "-o": "output",
+    "--output": "output",
+    "--date": "date",
+    "--time": "time",
+    "--connection": "connection",
+    "--attendees": "attendees",
+    "--apologies": "apologies",
+    "--student": "student",
+    "--next-meeting": "next_meeting",
+    "--follow-up": "follow_up",
+}
+
+
+def _argparse_help(argv: List[str]) -> None:
+    """Build the full argparse parser only when help is requested, so the
+    normal conversion path never pays the argparse import cost."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Convert a Zoom AI meeting summary into a supervision meeting log section."
     )
@@ -252,13 +271,57 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     parser.add_argument("--student", default="", help="Deprecated: use --attendees instead")
     parser.add_argument("--next-meeting", default="TBD", help="Details for the next meeting")
     parser.add_argument("--follow-up", help="Override the default follow-up note")
-    return parser.parse_args(argv)
+    parser.parse_args(argv)
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    if "-h" in argv or "--help" in argv:
+        _argparse_help(argv)
+
+    args = SimpleNamespace(
+        input=None,
+        output=None,
+        date="YYYY-MM-DD",
+        time="TBD",
+        connection="TBD",
+        attendees="",
+        apologies="",
+        student="",
+        next_meeting="TBD",
+        follow_up=None,
+    )
+
+    i = 0
+    count = len(argv)
+    while i < count:
+        token = argv[i]
+        if token.startswith("-") and token != "-":
+            name, eq, inline_value = token.partition("=")
+            attr = _FLAG_ATTRS.get(name)
+            if attr is None:
+                raise SystemExit(f"error: unrecognised argument '{token}'")
+            if eq:
+                value = inline_value
+            else:
+                i += 1
+                if i >= count:
+                    raise SystemExit(f"error: argument '{name}' expects a value")
+                value = argv[i]
+            setattr(args, attr, Path(value) if attr == "output" else value)
+        elif args.input is None:
+            args.input = Path(token)
+        else:
+            raise SystemExit(f"error: unexpected positional argument '{token}'")
+        i += 1
+
+    if args.input is None:
+        raise SystemExit("error: the input summary file is required (see --help)")
+    return args
 
 
 def main(argv: List[str]) -> int:
     args = parse_args(argv)
-    source_text = load_text(args.input)
-    parsed = parse_summary(source_text)
+    parsed = parse_summary(iter_lines(args.input))
     markdown = build_markdown(parsed, args)
 
     if args.output:
@@ -266,7 +329,13 @@ def main(argv: List[str]) -> int:
             args.output.write_text(markdown, encoding="utf-8")
         except OSError as exc:
             raise SystemExit(f"error: failed to write output file: {exc}") from exc
+    elif isinstance(sys.stdout, io.TextIOWrapper):
+        # One bulk encode + write to the raw buffer, skipping TextIOWrapper's
+        # per-chunk encoding and newline translation.
+        sys.stdout.buffer.write(markdown.encode("utf-8"))
+        sys.stdout.buffer.flush()
     else:
+        # Test harnesses may substitute stdout with a plain text stream.
         sys.stdout.write(markdown)
     return 0
 